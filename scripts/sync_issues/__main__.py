@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import sys
 from pathlib import Path
 
 from .github import DryRunClient, GitHubClient, GitHubError, RateLimitError
 from .loader import IssueLoader
-from .state import StateManager
+from .state import ETagCache, StateManager
 from .sync import ConsoleOutput, IssueSyncer
 
 
@@ -39,11 +40,25 @@ Examples:
         help="Path to state file (default: .github/.sync-state.json)",
     )
 
+    parser.add_argument(
+        "--etag-cache",
+        type=Path,
+        default=Path(__file__).parent.parent.parent / ".github" / ".sync-etags.json",
+        help="Path to HTTP ETag cache (default: .github/.sync-etags.json)",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=Path(__file__).parent.parent.parent / ".github" / ".sync-cache",
+        help="Directory for the parsed issue cache (default: .github/.sync-cache)",
+    )
+
     parser.add_argument(
         "--repo",
         type=str,
         default=None,
-        help="GitHub repo in owner/name format (default: from git remote)",
+        help="GitHub repo in owner/name format (default: from git remote, cached while origin is unchanged)",
     )
 
     parser.add_argument(
@@ -70,6 +85,19 @@ Examples:
         help="Show sync status without making changes",
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=IssueSyncer.MAX_CONCURRENCY,
+        help=f"Mutation batches in flight at once (default: {IssueSyncer.MAX_CONCURRENCY})",
+    )
+
+    parser.add_argument(
+        "--io-uring",
+        action="store_true",
+        help="Read issue files in batches via io_uring (Linux, requires liburing)",
+    )
+
     parser.add_argument(
         "--no-color",
         action="store_true",
@@ -79,6 +107,25 @@ Examples:
     return parser.parse_args()
 
 
+def read_origin_url() -> str | None:
+    # Reads .git/config directly so a warm run can validate the cached repo without spawning git.
+    import configparser
+
+    for parent in (Path.cwd(), *Path.cwd().parents):
+        if (parent / ".git").exists():
+            config_file = parent / ".git" / "config"
+            break
+    else:
+        return None
+
+    parser = configparser.ConfigParser(strict=False, interpolation=None)
+    try:
+        parser.read(config_file)
+    except (OSError, configparser.Error):
+        return None
+    return parser.get('remote "origin"', "url", fallback=None)
+
+
 def detect_repo() -> tuple[str, str]:
     import subprocess
 
@@ -134,6 +181,20 @@ def show_status(state: StateManager, output: ConsoleOutput):
             output.error(f"  {record.issue_id}: {record.error}")
 
 
+async def run_sync(
+    client: GitHubClient | DryRunClient,
+    loader: IssueLoader,
+    state: StateManager,
+    output: ConsoleOutput,
+    force: bool = False,
+    cache_dir: Path | None = None,
+    concurrency: int = IssueSyncer.MAX_CONCURRENCY,
+) -> dict[str, int]:
+    async with client:
+        syncer = IssueSyncer(client, loader, state, output, concurrency=concurrency, cache_dir=cache_dir)
+        return await syncer.sync(force=force)
+
+
 def main() -> int:
     args = parse_args()
     output = ConsoleOutput(use_color=not args.no_color)
@@ -142,12 +203,16 @@ def main() -> int:
     output.info("pdfvec Issue Sync")
     print()
 
+    if args.concurrency < 1:
+        output.error("--concurrency must be at least 1")
+        return 1
+
     if not args.issues_dir.exists():
         output.error(f"Issues directory not found: {args.issues_dir}")
         return 1
 
     try:
-        loader = IssueLoader(args.issues_dir)
+        loader = IssueLoader(args.issues_dir, use_io_uring=args.io_uring)
     except FileNotFoundError as e:
         output.error(str(e))
         return 1
@@ -156,6 +221,9 @@ def main() -> int:
 
     if args.reset:
         state.reset()
+        ETagCache(args.etag_cache).reset()
+        for cached in args.cache_dir.glob("*.pkl"):
+            cached.unlink()
         output.success("State cleared")
         return 0
 
@@ -165,6 +233,8 @@ def main() -> int:
 
     if args.repo:
         owner, repo = args.repo.split("/")
+    elif state.state.repo and state.state.remote_url is not None and state.state.remote_url == read_origin_url():
+        owner, repo = state.state.repo.split("/", 1)
     else:
         try:
             owner, repo = detect_repo()
@@ -172,17 +242,31 @@ def main() -> int:
             output.error(str(e))
             output.info("Use --repo owner/name to specify manually")
             return 1
+        state.state.repo = f"{owner}/{repo}"
+        state.state.remote_url = read_origin_url()
+        state.save()
 
     output.info(f"Repository: {owner}/{repo}")
     output.info(f"Dry run: {'yes' if args.dry_run else 'no'}")
     print()
 
-    client_cls = DryRunClient if args.dry_run else GitHubClient
-
+    client: GitHubClient | DryRunClient
     try:
-        with client_cls(owner, repo) as client:
-            syncer = IssueSyncer(client, loader, state, output)
-            summary = syncer.sync(force=args.force)
+        if args.dry_run:
+            client = DryRunClient(owner, repo)
+        else:
+            client = GitHubClient(owner, repo, etag_cache=ETagCache(args.etag_cache))
+        summary = asyncio.run(
+            run_sync(
+                client,
+                loader,
+                state,
+                output,
+                force=args.force,
+                cache_dir=args.cache_dir,
+                concurrency=args.concurrency,
+            )
+        )
 
     except RateLimitError as e:
         output.error(f"Rate limited. Try again after {e.reset_at}")
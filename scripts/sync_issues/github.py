@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import os
+import random
 import time
+from collections.abc import Sequence
 from dataclasses import dataclass
-from functools import cached_property
-from typing import Any, Iterator
-from urllib.parse import urljoin
+from typing import TYPE_CHECKING, Any, AsyncIterator
 
 import httpx
+import msgspec
+import orjson
+
+from .models import normalize_title
+
+if TYPE_CHECKING:
+    from .state import ETagCache
 
 
 class GitHubError(Exception):
@@ -23,85 +31,227 @@ class RateLimitError(GitHubError):
         self.reset_at = reset_at
 
 
-@dataclass(frozen=True, slots=True)
-class GitHubIssue:
+class RateLimiter:
+    # Requests are only paced once the primary budget runs low; above the reserve
+    # GitHub's limit is far from the bottleneck and spreading calls would only add latency.
+    RESERVE = 100
+
+    def __init__(self) -> None:
+        # REST ("core") and GraphQL draw on separate budgets, named by X-RateLimit-Resource.
+        self.remaining: dict[str, int] = {}
+        self.reset_at: dict[str, float] = {}
+        self.blocked_until = 0.0
+        self.lock = asyncio.Lock()
+
+    async def acquire(self, resource: str = "core") -> None:
+        async with self.lock:
+            now = time.time()
+            if self.blocked_until > now:
+                await asyncio.sleep(self.blocked_until - now)
+                now = time.time()
+            remaining = self.remaining.get(resource)
+            reset_at = self.reset_at.get(resource, 0.0)
+            if remaining is None or remaining > self.RESERVE or reset_at <= now:
+                return
+            delay = max(0.0, (reset_at - now) / max(remaining, 1))
+            await asyncio.sleep(delay)
+
+    def update(self, response: httpx.Response) -> None:
+        headers = response.headers
+        if "X-RateLimit-Remaining" in headers:
+            resource = headers.get("X-RateLimit-Resource", "core")
+            self.remaining[resource] = int(headers["X-RateLimit-Remaining"])
+            self.reset_at[resource] = float(headers.get("X-RateLimit-Reset", 0))
+        if response.status_code in (403, 429) and "Retry-After" in headers:
+            self.blocked_until = max(self.blocked_until, time.time() + float(headers["Retry-After"]))
+
+
+# Only the fields the syncer reads are declared; msgspec skips every other key in
+# GitHub's payloads without allocating it. None of these structs can form reference
+# cycles, so they are excluded from GC tracking.
+class _RawLabelRef(msgspec.Struct, gc=False):
+    name: str
+
+
+class _RawMilestoneRef(msgspec.Struct, gc=False):
+    number: int
+
+
+class _RawPullRequestRef(msgspec.Struct, gc=False):
+    pass
+
+
+class _RawIssue(msgspec.Struct, gc=False):
+    number: int
+    title: str
+    state: str
+    body: str | None = None
+    labels: list[_RawLabelRef] = []
+    milestone: _RawMilestoneRef | None = None
+    node_id: str = ""
+    pull_request: _RawPullRequestRef | None = None
+
+
+class _RawLabel(msgspec.Struct, gc=False):
+    name: str
+    color: str
+    description: str | None = None
+    node_id: str = ""
+
+
+class GitHubIssue(msgspec.Struct, frozen=True, gc=False):
     number: int
     title: str
     body: str
     state: str
     labels: tuple[str, ...]
     milestone_number: int | None
+    node_id: str = ""
+
+    @classmethod
+    def from_raw(cls, raw: _RawIssue) -> GitHubIssue:
+        return cls(
+            number=raw.number,
+            title=raw.title,
+            body=raw.body or "",
+            state=raw.state,
+            labels=tuple(lbl.name for lbl in raw.labels),
+            milestone_number=raw.milestone.number if raw.milestone else None,
+            node_id=raw.node_id,
+        )
 
     @classmethod
-    def from_response(cls, data: dict[str, Any]) -> GitHubIssue:
+    def from_graphql(cls, data: dict[str, Any]) -> GitHubIssue:
         return cls(
             number=data["number"],
             title=data["title"],
             body=data.get("body") or "",
-            state=data["state"],
-            labels=tuple(lbl["name"] for lbl in data.get("labels", [])),
+            state=data["state"].lower(),
+            labels=tuple(lbl["name"] for lbl in data["labels"]["nodes"]),
             milestone_number=data["milestone"]["number"] if data.get("milestone") else None,
+            node_id=data["id"],
         )
 
 
-@dataclass(frozen=True, slots=True)
-class GitHubMilestone:
+class GitHubMilestone(msgspec.Struct, frozen=True, gc=False):
     number: int
     title: str
     state: str
-
-    @classmethod
-    def from_response(cls, data: dict[str, Any]) -> GitHubMilestone:
-        return cls(number=data["number"], title=data["title"], state=data["state"])
+    node_id: str = ""
 
 
-@dataclass(frozen=True, slots=True)
-class GitHubLabel:
+class GitHubLabel(msgspec.Struct, frozen=True, gc=False):
     name: str
     color: str
     description: str
+    node_id: str = ""
 
     @classmethod
-    def from_response(cls, data: dict[str, Any]) -> GitHubLabel:
-        return cls(name=data["name"], color=data["color"], description=data.get("description") or "")
+    def from_raw(cls, raw: _RawLabel) -> GitHubLabel:
+        return cls(name=raw.name, color=raw.color, description=raw.description or "", node_id=raw.node_id)
+
+
+def _json_or_none(content: bytes) -> dict[str, Any] | None:
+    # Gateway errors come back as HTML, which must not mask the status as a decode error.
+    try:
+        payload = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+_ISSUE_DECODER = msgspec.json.Decoder(_RawIssue)
+_ISSUE_PAGE_DECODER = msgspec.json.Decoder(list[_RawIssue])
+_MILESTONE_DECODER = msgspec.json.Decoder(GitHubMilestone)
+_MILESTONE_PAGE_DECODER = msgspec.json.Decoder(list[GitHubMilestone])
+_LABEL_DECODER = msgspec.json.Decoder(_RawLabel)
+_LABEL_PAGE_DECODER = msgspec.json.Decoder(list[_RawLabel])
+_ENCODER = msgspec.json.Encoder()
+
+
+@dataclass(frozen=True, slots=True)
+class IssueMutation:
+    title: str
+    body: str
+    labels: list[str] | None = None
+    milestone: int | None = None
+    number: int | None = None
+
+    @property
+    def is_create(self) -> bool:
+        return self.number is None
+
+
+@dataclass(frozen=True, slots=True)
+class MutationContext:
+    repository_id: str
+    label_ids: dict[str, str]
+    milestone_ids: dict[int, str]
+
+
+ISSUE_FIELDS = "issue { id number title body state labels(first: 100) { nodes { name } } milestone { number } }"
 
 
 class GitHubClient:
     BASE_URL = "https://api.github.com"
-
-    def __init__(self, owner: str, repo: str, token: str | None = None):
+    GRAPHQL_URL = "https://api.github.com/graphql"
+    # createLabel is still gated behind the "bane" schema preview.
+    LABELS_PREVIEW = "application/vnd.github.bane-preview+json"
+    LABEL_BATCH_SIZE = 50
+    MAX_ATTEMPTS = 6
+    GATEWAY_STATUSES = frozenset({502, 503, 504})
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "PATCH", "DELETE"})
+
+    def __init__(self, owner: str, repo: str, token: str | None = None, etag_cache: ETagCache | None = None):
         self.owner = owner
         self.repo = repo
+        self._etags = etag_cache
+        self._base = f"{self.BASE_URL}/repos/{owner}/{repo}/"
         self._token = token or os.environ.get("GITHUB_TOKEN")
         if not self._token:
             raise GitHubError("GITHUB_TOKEN environment variable required")
-        self._client = httpx.Client(timeout=30.0)
-
-    def close(self):
-        self._client.close()
-
-    def __enter__(self):
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            headers={
+                "Authorization": f"Bearer {self._token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+                "Accept-Encoding": "gzip",
+            },
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=60),
+        )
+        self._limiter = RateLimiter()
+        self._mutation_context: MutationContext | None = None
+        self._context_lock = asyncio.Lock()
+        self._context_generation = 0
+        self._issue_node_ids: dict[int, str] = {}
+
+    async def close(self):
+        await self._client.aclose()
+        if self._etags is not None:
+            self._etags.save()
+
+    async def __aenter__(self):
         return self
 
-    def __exit__(self, *args):
-        self.close()
-
-    @cached_property
-    def _headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self._token}",
-            "Accept": "application/vnd.github+json",
-            "X-GitHub-Api-Version": "2022-11-28",
-        }
+    async def __aexit__(self, *args):
+        await self.close()
 
     def _url(self, path: str) -> str:
-        return urljoin(self.BASE_URL, f"/repos/{self.owner}/{self.repo}/{path.lstrip('/')}")
+        return self._base + path.lstrip("/")
 
-    def _request(self, method: str, path: str, **kwargs) -> dict[str, Any] | list[Any]:
+    async def _request(
+        self, method: str, path: str, decoder: msgspec.json.Decoder[Any] | None = None, **kwargs: Any
+    ) -> Any:
         url = self._url(path)
-        response = self._client.request(method, url, headers=self._headers, **kwargs)
+        cache_key = str(httpx.URL(url, params=kwargs.get("params"))) if method == "GET" and self._etags else None
+        cached = self._etags.get(cache_key) if cache_key and self._etags else None
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        response = await self._send(method, url, headers=headers, **kwargs)
 
-        if response.status_code == 403 and "rate limit" in response.text.lower():
+        if response.status_code == 429 or (response.status_code == 403 and "rate limit" in response.text.lower()):
             reset_at = int(response.headers.get("X-RateLimit-Reset", 0))
             raise RateLimitError(reset_at)
 
@@ -109,36 +259,106 @@ class GitHubClient:
             raise GitHubError(
                 f"{method} {path} failed: {response.status_code}",
                 status_code=response.status_code,
-                response=response.json() if response.text else None,
+                response=_json_or_none(response.content),
             )
 
-        return response.json() if response.text else {}
+        content = cached[1] if response.status_code == 304 and cached else response.content
+        if cache_key and self._etags and response.status_code != 304 and "ETag" in response.headers:
+            self._etags.put(cache_key, response.headers["ETag"], content)
+
+        if not content:
+            return {}
+        return decoder.decode(content) if decoder else orjson.loads(content)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        json: Any = None,
+        idempotent: bool | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        if json is not None:
+            kwargs["content"] = _ENCODER.encode(json)
+            headers = {**(headers or {}), "Content-Type": "application/json"}
+        if idempotent is None:
+            idempotent = method in self.IDEMPOTENT_METHODS
+        resource = "graphql" if url == self.GRAPHQL_URL else "core"
+        for attempt in range(self.MAX_ATTEMPTS):
+            await self._limiter.acquire(resource)
+            response = await self._client.request(method, url, headers=headers, **kwargs)
+            self._limiter.update(response)
+            if attempt == self.MAX_ATTEMPTS - 1 or not self._is_retryable(response, idempotent):
+                break
+            await asyncio.sleep(min(32, 2**attempt) + random.uniform(0, 1))
+        return response
+
+    async def _graphql(
+        self, query: str, variables: dict[str, Any] | None = None, accept: str | None = None
+    ) -> dict[str, Any]:
+        headers = {"Accept": accept} if accept else None
+        response = await self._send(
+            "POST",
+            self.GRAPHQL_URL,
+            headers=headers,
+            json={"query": query, "variables": variables or {}},
+            idempotent=not query.startswith("mutation"),
+        )
+
+        if response.status_code == 429 or (response.status_code == 403 and "rate limit" in response.text.lower()):
+            reset_at = int(response.headers.get("X-RateLimit-Reset", 0))
+            raise RateLimitError(reset_at)
 
-    def _paginate(self, path: str, params: dict | None = None) -> Iterator[dict[str, Any]]:
+        payload = _json_or_none(response.content) or {}
+        if response.status_code >= 400 or not payload.get("data"):
+            raise GitHubError(
+                f"GraphQL request failed: {response.status_code}",
+                status_code=response.status_code,
+                response=payload or None,
+            )
+        return payload
+
+    def _is_retryable(self, response: httpx.Response, idempotent: bool) -> bool:
+        status = response.status_code
+        if status == 429 or (status == 403 and "secondary rate" in response.text.lower()):
+            return True
+        # A gateway error can arrive after a write was applied, so resending a create could duplicate it.
+        return idempotent and status in self.GATEWAY_STATUSES
+
+    async def _paginate(
+        self, path: str, decoder: msgspec.json.Decoder[Any], params: dict | None = None
+    ) -> AsyncIterator[Any]:
         params = {**(params or {}), "per_page": 100, "page": 1}
         while True:
-            items = self._request("GET", path, params=params)
+            items = await self._request("GET", path, decoder=decoder, params=params)
             if not items:
                 break
-            yield from items
+            for item in items:
+                yield item
             if len(items) < 100:
                 break
             params["page"] += 1
 
-    def get_issue(self, number: int) -> GitHubIssue | None:
+    async def get_issue(self, number: int) -> GitHubIssue | None:
         try:
-            data = self._request("GET", f"issues/{number}")
-            return GitHubIssue.from_response(data)
+            raw = await self._request("GET", f"issues/{number}", decoder=_ISSUE_DECODER)
+            return GitHubIssue.from_raw(raw)
         except GitHubError as e:
             if e.status_code == 404:
                 return None
             raise
 
-    def list_issues(self, state: str = "all") -> Iterator[GitHubIssue]:
-        for data in self._paginate("issues", {"state": state}):
-            yield GitHubIssue.from_response(data)
+    async def list_issues(self, state: str = "all") -> AsyncIterator[GitHubIssue]:
+        async for raw in self._paginate("issues", _ISSUE_PAGE_DECODER, {"state": state}):
+            # The issues endpoint also returns pull requests; they are never sync targets.
+            if raw.pull_request is not None:
+                continue
+            issue = GitHubIssue.from_raw(raw)
+            self._issue_node_ids[issue.number] = issue.node_id
+            yield issue
 
-    def create_issue(
+    async def create_issue(
         self,
         title: str,
         body: str,
@@ -150,10 +370,10 @@ class GitHubClient:
             payload["labels"] = labels
         if milestone:
             payload["milestone"] = milestone
-        data = self._request("POST", "issues", json=payload)
-        return GitHubIssue.from_response(data)
+        raw = await self._request("POST", "issues", decoder=_ISSUE_DECODER, json=payload)
+        return GitHubIssue.from_raw(raw)
 
-    def update_issue(
+    async def update_issue(
         self,
         number: int,
         title: str | None = None,
@@ -173,33 +393,155 @@ class GitHubClient:
             payload["milestone"] = milestone
         if state is not None:
             payload["state"] = state
-        data = self._request("PATCH", f"issues/{number}", json=payload)
-        return GitHubIssue.from_response(data)
-
-    def list_milestones(self, state: str = "all") -> Iterator[GitHubMilestone]:
-        for data in self._paginate("milestones", {"state": state}):
-            yield GitHubMilestone.from_response(data)
-
-    def create_milestone(self, title: str, description: str = "") -> GitHubMilestone:
-        data = self._request("POST", "milestones", json={"title": title, "description": description})
-        return GitHubMilestone.from_response(data)
-
-    def list_labels(self) -> Iterator[GitHubLabel]:
-        for data in self._paginate("labels"):
-            yield GitHubLabel.from_response(data)
+        raw = await self._request("PATCH", f"issues/{number}", decoder=_ISSUE_DECODER, json=payload)
+        return GitHubIssue.from_raw(raw)
+
+    async def batch_mutate(self, operations: Sequence[IssueMutation]) -> list[GitHubIssue | GitHubError]:
+        context = await self._get_mutation_context()
+        declarations = []
+        fields = []
+        variables: dict[str, Any] = {}
+
+        for i, op in enumerate(operations):
+            issue_input: dict[str, Any] = {"title": op.title, "body": op.body}
+            if op.labels is not None:
+                issue_input["labelIds"] = [context.label_ids[lbl] for lbl in op.labels if lbl in context.label_ids]
+            if op.milestone is not None and op.milestone in context.milestone_ids:
+                issue_input["milestoneId"] = context.milestone_ids[op.milestone]
+
+            if op.is_create:
+                issue_input["repositoryId"] = context.repository_id
+                declarations.append(f"$input{i}: CreateIssueInput!")
+                fields.append(f"op{i}: createIssue(input: $input{i}) {{ {ISSUE_FIELDS} }}")
+            else:
+                assert op.number is not None
+                issue_input["id"] = await self._issue_node_id(op.number)
+                declarations.append(f"$input{i}: UpdateIssueInput!")
+                fields.append(f"op{i}: updateIssue(input: $input{i}) {{ {ISSUE_FIELDS} }}")
+            variables[f"input{i}"] = issue_input
+
+        mutation = f"mutation({', '.join(declarations)}) {{ {' '.join(fields)} }}"
+        payload = await self._graphql(mutation, variables)
+
+        errors: dict[str, str] = {}
+        for error in payload.get("errors", []):
+            alias = (error.get("path") or ["op?"])[0]
+            errors[alias] = error.get("message", "unknown error")
+
+        results: list[GitHubIssue | GitHubError] = []
+        for i in range(len(operations)):
+            alias = f"op{i}"
+            node = payload["data"].get(alias)
+            if node is None or node.get("issue") is None:
+                message = f"GraphQL {alias} failed: {errors.get(alias, 'no result')}"
+                results.append(GitHubError(message, response=payload))
+                continue
+            issue = GitHubIssue.from_graphql(node["issue"])
+            self._issue_node_ids[issue.number] = issue.node_id
+            results.append(issue)
+        return results
+
+    async def _get_mutation_context(self) -> MutationContext:
+        # Concurrent batches share one fetch instead of each re-listing labels and milestones.
+        async with self._context_lock:
+            if self._mutation_context is not None:
+                return self._mutation_context
+            generation = self._context_generation
+            payload = await self._graphql(
+                "query($owner: String!, $name: String!) { repository(owner: $owner, name: $name) { id } }",
+                {"owner": self.owner, "name": self.repo},
+            )
+            context = MutationContext(
+                repository_id=payload["data"]["repository"]["id"],
+                label_ids={label.name: label.node_id async for label in self.list_labels()},
+                milestone_ids={ms.number: ms.node_id async for ms in self.list_milestones()},
+            )
+            # A label or milestone created mid-fetch may be missing; use the result once but don't cache it.
+            if generation == self._context_generation:
+                self._mutation_context = context
+            return context
+
+    def _invalidate_mutation_context(self) -> None:
+        self._mutation_context = None
+        self._context_generation += 1
+
+    async def _issue_node_id(self, number: int) -> str:
+        if number not in self._issue_node_ids:
+            issue = await self.get_issue(number)
+            if issue is None:
+                raise GitHubError(f"Issue {number} not found", status_code=404)
+            self._issue_node_ids[number] = issue.node_id
+        return self._issue_node_ids[number]
+
+    async def list_milestones(self, state: str = "all") -> AsyncIterator[GitHubMilestone]:
+        async for milestone in self._paginate("milestones", _MILESTONE_PAGE_DECODER, {"state": state}):
+            yield milestone
+
+    async def create_milestone(self, title: str, description: str = "") -> GitHubMilestone:
+        milestone: GitHubMilestone = await self._request(
+            "POST", "milestones", decoder=_MILESTONE_DECODER, json={"title": title, "description": description}
+        )
+        self._invalidate_mutation_context()
+        return milestone
 
-    def create_label(self, name: str, color: str, description: str = "") -> GitHubLabel:
-        data = self._request("POST", "labels", json={"name": name, "color": color, "description": description})
-        return GitHubLabel.from_response(data)
+    async def bulk_create_milestones(self, milestones: Sequence[tuple[str, str]]) -> list[GitHubMilestone]:
+        return list(await asyncio.gather(*[self.create_milestone(title, desc) for title, desc in milestones]))
+
+    async def bulk_create_labels(self, labels: Sequence[tuple[str, str, str]]) -> list[GitHubLabel]:
+        context = await self._get_mutation_context()
+        created: list[GitHubLabel] = []
+
+        for start in range(0, len(labels), self.LABEL_BATCH_SIZE):
+            batch = labels[start : start + self.LABEL_BATCH_SIZE]
+            declarations = [f"$input{i}: CreateLabelInput!" for i in range(len(batch))]
+            fields = [
+                f"op{i}: createLabel(input: $input{i}) {{ label {{ id name color description }} }}"
+                for i in range(len(batch))
+            ]
+            variables = {
+                f"input{i}": {"repositoryId": context.repository_id, "name": name, "color": color, "description": desc}
+                for i, (name, color, desc) in enumerate(batch)
+            }
+            payload = await self._graphql(
+                f"mutation({', '.join(declarations)}) {{ {' '.join(fields)} }}", variables, accept=self.LABELS_PREVIEW
+            )
+            if payload.get("errors"):
+                messages = "; ".join(error.get("message", "unknown error") for error in payload["errors"])
+                raise GitHubError(f"createLabel failed: {messages}", response=payload)
+
+            for i in range(len(batch)):
+                node = payload["data"][f"op{i}"]["label"]
+                created.append(
+                    GitHubLabel(
+                        name=node["name"],
+                        color=node["color"],
+                        description=node.get("description") or "",
+                        node_id=node["id"],
+                    )
+                )
+
+        self._invalidate_mutation_context()
+        return created
+
+    async def list_labels(self) -> AsyncIterator[GitHubLabel]:
+        async for raw in self._paginate("labels", _LABEL_PAGE_DECODER):
+            yield GitHubLabel.from_raw(raw)
+
+    async def create_label(self, name: str, color: str, description: str = "") -> GitHubLabel:
+        raw = await self._request(
+            "POST", "labels", decoder=_LABEL_DECODER, json={"name": name, "color": color, "description": description}
+        )
+        self._invalidate_mutation_context()
+        return GitHubLabel.from_raw(raw)
 
-    def update_label(self, name: str, color: str | None = None, description: str | None = None) -> GitHubLabel:
+    async def update_label(self, name: str, color: str | None = None, description: str | None = None) -> GitHubLabel:
         payload = {}
         if color is not None:
             payload["color"] = color
         if description is not None:
             payload["description"] = description
-        data = self._request("PATCH", f"labels/{name}", json=payload)
-        return GitHubLabel.from_response(data)
+        raw = await self._request("PATCH", f"labels/{name}", decoder=_LABEL_DECODER, json=payload)
+        return GitHubLabel.from_raw(raw)
 
 
 class DryRunClient:
@@ -209,25 +551,30 @@ class DryRunClient:
         self._issue_counter = 1000
         self._milestone_counter = 100
         self._issues: dict[int, GitHubIssue] = {}
+        self._by_title: dict[str, GitHubIssue] = {}
         self._milestones: dict[str, GitHubMilestone] = {}
         self._labels: dict[str, GitHubLabel] = {}
 
-    def close(self):
+    async def close(self):
         pass
 
-    def __enter__(self):
+    async def __aenter__(self):
         return self
 
-    def __exit__(self, *args):
+    async def __aexit__(self, *args):
         pass
 
-    def get_issue(self, number: int) -> GitHubIssue | None:
+    async def get_issue(self, number: int) -> GitHubIssue | None:
         return self._issues.get(number)
 
-    def list_issues(self, state: str = "all") -> Iterator[GitHubIssue]:
-        yield from self._issues.values()
+    async def list_issues(self, state: str = "all") -> AsyncIterator[GitHubIssue]:
+        for issue in self._issues.values():
+            yield issue
 
-    def create_issue(
+    def find_by_title(self, title: str) -> GitHubIssue | None:
+        return self._by_title.get(normalize_title(title))
+
+    async def create_issue(
         self,
         title: str,
         body: str,
@@ -244,9 +591,10 @@ class DryRunClient:
             milestone_number=milestone,
         )
         self._issues[issue.number] = issue
+        self._by_title[normalize_title(issue.title)] = issue
         return issue
 
-    def update_issue(
+    async def update_issue(
         self,
         number: int,
         title: str | None = None,
@@ -267,26 +615,51 @@ class DryRunClient:
             milestone_number=milestone if milestone is not None else existing.milestone_number,
         )
         self._issues[number] = issue
+        old_title = normalize_title(existing.title)
+        if self._by_title.get(old_title) is existing:
+            del self._by_title[old_title]
+        self._by_title[normalize_title(issue.title)] = issue
         return issue
 
-    def list_milestones(self, state: str = "all") -> Iterator[GitHubMilestone]:
-        yield from self._milestones.values()
-
-    def create_milestone(self, title: str, description: str = "") -> GitHubMilestone:
+    async def batch_mutate(self, operations: Sequence[IssueMutation]) -> list[GitHubIssue | GitHubError]:
+        results: list[GitHubIssue | GitHubError] = []
+        for op in operations:
+            if op.is_create:
+                results.append(await self.create_issue(op.title, op.body, op.labels, op.milestone))
+                continue
+            assert op.number is not None
+            try:
+                results.append(await self.update_issue(op.number, op.title, op.body, op.labels, op.milestone))
+            except GitHubError as e:
+                results.append(e)
+        return results
+
+    async def list_milestones(self, state: str = "all") -> AsyncIterator[GitHubMilestone]:
+        for milestone in self._milestones.values():
+            yield milestone
+
+    async def create_milestone(self, title: str, description: str = "") -> GitHubMilestone:
         self._milestone_counter += 1
         milestone = GitHubMilestone(number=self._milestone_counter, title=title, state="open")
         self._milestones[title] = milestone
         return milestone
 
-    def list_labels(self) -> Iterator[GitHubLabel]:
-        yield from self._labels.values()
+    async def bulk_create_milestones(self, milestones: Sequence[tuple[str, str]]) -> list[GitHubMilestone]:
+        return [await self.create_milestone(title, desc) for title, desc in milestones]
+
+    async def bulk_create_labels(self, labels: Sequence[tuple[str, str, str]]) -> list[GitHubLabel]:
+        return [await self.create_label(name, color, desc) for name, color, desc in labels]
+
+    async def list_labels(self) -> AsyncIterator[GitHubLabel]:
+        for label in self._labels.values():
+            yield label
 
-    def create_label(self, name: str, color: str, description: str = "") -> GitHubLabel:
+    async def create_label(self, name: str, color: str, description: str = "") -> GitHubLabel:
         label = GitHubLabel(name=name, color=color, description=description)
         self._labels[name] = label
         return label
 
-    def update_label(self, name: str, color: str | None = None, description: str | None = None) -> GitHubLabel:
+    async def update_label(self, name: str, color: str | None = None, description: str | None = None) -> GitHubLabel:
         existing = self._labels.get(name)
         if not existing:
             raise GitHubError(f"Label {name} not found", status_code=404)
@@ -1,12 +1,80 @@
 from __future__ import annotations
 
-import json
+import os
+import sys
+from collections import defaultdict, deque
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterator
 
-from .models import Issue
+import orjson
+
+from .models import Issue, normalize_title
+
+IO_URING_BATCH = 64
+IO_URING_READ_SIZE = 64 * 1024
+
+
+def _read_files_io_uring(paths: Sequence[str]) -> list[bytes]:
+    import liburing
+
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    contents: list[bytes] = []
+    liburing.io_uring_queue_init(IO_URING_BATCH * 3, ring)
+    try:
+        liburing.io_uring_register_files_sparse(ring, IO_URING_BATCH)
+        for start in range(0, len(paths), IO_URING_BATCH):
+            batch = paths[start : start + IO_URING_BATCH]
+            buffers = [bytearray(IO_URING_READ_SIZE) for _ in batch]
+            sizes = [-1] * len(batch)
+
+            for slot, path in enumerate(batch):
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_open_direct(sqe, path, liburing.O_RDONLY, slot)
+                sqe.flags = liburing.IOSQE_IO_LINK
+                sqe.user_data = slot * 3
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_read(sqe, slot, buffers[slot], 0)
+                # A short read breaks a soft link and would cancel the close.
+                sqe.flags = liburing.IOSQE_IO_HARDLINK | liburing.IOSQE_FIXED_FILE
+                sqe.user_data = slot * 3 + 1
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_close_direct(sqe, slot)
+                sqe.user_data = slot * 3 + 2
+            liburing.io_uring_submit(ring)
+
+            for _ in range(len(batch) * 3):
+                liburing.io_uring_wait_cqe(ring, cqe)
+                entry = cqe[0]
+                slot, op = divmod(entry.user_data, 3)
+                if op == 1:
+                    try:
+                        sizes[slot] = entry.res
+                    except OSError:
+                        sizes[slot] = -1
+                liburing.io_uring_cqe_seen(ring, entry)
+
+            for path, buffer, size in zip(batch, buffers, sizes, strict=True):
+                if 0 <= size < IO_URING_READ_SIZE:
+                    contents.append(bytes(buffer[:size]))
+                else:
+                    with open(path, "rb") as f:
+                        contents.append(f.read())
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    return contents
+
+
+def _scan_json_files(root: str) -> Iterator[str]:
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_json_files(entry.path)
+            elif entry.name.endswith(".json") and entry.is_file():
+                yield entry.path
 
 
 @dataclass(frozen=True, slots=True)
@@ -23,8 +91,11 @@ class MilestoneDef:
 
 
 class IssueLoader:
-    def __init__(self, issues_dir: Path):
+    MAX_WORKERS = 16
+
+    def __init__(self, issues_dir: Path, use_io_uring: bool = False):
         self.issues_dir = issues_dir
+        self.use_io_uring = use_io_uring and sys.platform == "linux"
         self._validate_structure()
 
     def _validate_structure(self):
@@ -34,55 +105,69 @@ class IssueLoader:
             raise FileNotFoundError(f"Missing required files: {missing}")
 
     def load_labels(self) -> list[LabelDef]:
-        data = json.loads((self.issues_dir / "_labels.json").read_text())
+        data = orjson.loads((self.issues_dir / "_labels.json").read_bytes())
         return [LabelDef(name=lbl["name"], color=lbl["color"], description=lbl.get("description", "")) for lbl in data["labels"]]
 
     def load_milestones(self) -> list[MilestoneDef]:
-        data = json.loads((self.issues_dir / "_milestones.json").read_text())
+        data = orjson.loads((self.issues_dir / "_milestones.json").read_bytes())
         return [MilestoneDef(title=ms["title"], description=ms.get("description", "")) for ms in data["milestones"]]
 
     def load_index(self) -> dict:
         index_file = self.issues_dir / "_index.json"
         if not index_file.exists():
             raise FileNotFoundError("_index.json not found")
-        return json.loads(index_file.read_text())
+        return orjson.loads(index_file.read_bytes())
 
-    def iter_issue_files(self) -> Iterator[Path]:
+    def iter_issue_files(self) -> Iterator[str]:
         for subdir in ["epics", "stories"]:
-            path = self.issues_dir / subdir
-            if path.exists():
-                yield from path.rglob("*.json")
+            path = os.path.join(self.issues_dir, subdir)
+            if os.path.isdir(path):
+                yield from _scan_json_files(path)
+
+    def load_issue(self, path: str | Path) -> Issue:
+        path = Path(path)
+        return self._parse_issue(path, path.read_bytes())
 
-    def load_issue(self, path: Path) -> Issue:
-        data = json.loads(path.read_text())
-        return Issue.from_json(data, source=path.relative_to(self.issues_dir))
+    def _parse_issue(self, path: str | Path, content: bytes) -> Issue:
+        return Issue.from_json(content, source=Path(path).relative_to(self.issues_dir))
 
     def load_all_issues(self) -> list[Issue]:
-        issues = []
-        for path in self.iter_issue_files():
-            issues.append(self.load_issue(path))
-        return issues
+        paths = list(self.iter_issue_files())
+        if self.use_io_uring:
+            try:
+                contents = _read_files_io_uring(paths)
+            except (ImportError, OSError):
+                pass
+            else:
+                return [self._parse_issue(path, content) for path, content in zip(paths, contents, strict=True)]
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            return list(executor.map(self.load_issue, paths))
 
     def topological_sort(self, issues: Sequence[Issue]) -> list[Issue]:
         by_id = {i.id: i for i in issues}
-        visited: set[str] = set()
-        result: list[Issue] = []
+        in_degree = dict.fromkeys(by_id, 0)
+        dependents: dict[str, list[str]] = {issue_id: [] for issue_id in by_id}
 
-        def visit(issue_id: str):
-            if issue_id in visited:
-                return
-            visited.add(issue_id)
-            issue = by_id.get(issue_id)
-            if issue is None:
-                return
-            for dep_id in issue.depends_on:
-                visit(dep_id)
-            if issue.epic:
-                visit(issue.epic)
-            result.append(issue)
+        for issue in by_id.values():
+            prerequisites = [*issue.depends_on, issue.epic] if issue.epic else issue.depends_on
+            for prereq_id in prerequisites:
+                if prereq_id in by_id and prereq_id != issue.id:
+                    dependents[prereq_id].append(issue.id)
+                    in_degree[issue.id] += 1
 
-        for issue in issues:
-            visit(issue.id)
+        queue = deque(issue_id for issue_id, degree in in_degree.items() if degree == 0)
+        result: list[Issue] = []
+        while queue:
+            issue_id = queue.popleft()
+            result.append(by_id[issue_id])
+            for dependent_id in dependents[issue_id]:
+                in_degree[dependent_id] -= 1
+                if in_degree[dependent_id] == 0:
+                    queue.append(dependent_id)
+
+        if len(result) < len(by_id):
+            emitted = {issue.id for issue in result}
+            result.extend(issue for issue in by_id.values() if issue.id not in emitted)
 
         return result
 
@@ -91,27 +176,28 @@ class IssueIndex:
     def __init__(self, issues: Sequence[Issue]):
         self._by_id: dict[str, Issue] = {i.id: i for i in issues}
         self._by_title: dict[str, Issue] = {}
-        self._children: dict[str, list[str]] = {}
+        self._children: defaultdict[str, list[str]] = defaultdict(list)
+        self._title_keys: dict[str, str] = {}
 
         for issue in issues:
-            normalized = self._normalize_title(issue.title)
-            self._by_title[normalized] = issue
+            self._by_title[issue.normalized_title] = issue
 
             if issue.epic:
-                self._children.setdefault(issue.epic, []).append(issue.id)
+                self._children[issue.epic].append(issue.id)
 
-    @staticmethod
-    def _normalize_title(title: str) -> str:
-        return title.lower().strip()
+    _normalize_title = staticmethod(normalize_title)
 
     def get(self, issue_id: str) -> Issue | None:
         return self._by_id.get(issue_id)
 
     def find_by_title(self, title: str) -> Issue | None:
-        return self._by_title.get(self._normalize_title(title))
+        key = self._title_keys.get(title)
+        if key is None:
+            key = self._title_keys[title] = self._normalize_title(title)
+        return self._by_title.get(key)
 
     def children_of(self, epic_id: str) -> list[Issue]:
-        child_ids = self._children.get(epic_id, [])
+        child_ids = self._children.get(epic_id, ())
         return [self._by_id[cid] for cid in child_ids if cid in self._by_id]
 
     def all_ids(self) -> set[str]:
@@ -3,11 +3,21 @@ from __future__ import annotations
 import enum
 import hashlib
 import json
-from dataclasses import dataclass, field
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import cached_property
+from io import StringIO
 from pathlib import Path
 from typing import Any
 
+import msgspec
+
+CONTENT_HASH_ALGO = "blake2b-8"
+
+
+def normalize_title(title: str) -> str:
+    return title.lower().strip()
+
 
 class SyncAction(enum.Enum):
     CREATE = "create"
@@ -34,29 +44,28 @@ class IssueRef:
         return self.id
 
 
-@dataclass(slots=True)
-class Issue:
+class Issue(msgspec.Struct, dict=True):
     id: str
     title: str
     type: str
     status: str
     priority: str
-    labels: list[str]
-    milestone: str
-    description: str
-    acceptance_criteria: list[dict[str, Any]]
+    labels: list[str] = []
+    milestone: str = ""
+    description: str = ""
+    acceptance_criteria: list[dict[str, Any]] = []
     epic: str | None = None
-    depends_on: list[str] = field(default_factory=list)
-    blocks: list[str] = field(default_factory=list)
+    depends_on: list[str] = []
+    blocks: list[str] = []
     user_story: str | None = None
-    technical_context: dict[str, Any] = field(default_factory=dict)
+    technical_context: dict[str, Any] = {}
     state_machine: dict[str, Any] | None = None
-    out_of_scope: list[str] = field(default_factory=list)
-    open_questions: list[str] = field(default_factory=list)
+    out_of_scope: list[str] = []
+    open_questions: list[str] = []
     estimate: dict[str, Any] | None = None
-    children: list[str] = field(default_factory=list)
-    goals: list[str] = field(default_factory=list)
-    design_principles: list[str] = field(default_factory=list)
+    children: list[str] = []
+    goals: list[str] = []
+    design_principles: list[str] = []
     visual_mockups: dict[str, Any] | None = None
     interaction_patterns: dict[str, Any] | None = None
     responsive_behavior: dict[str, Any] | None = None
@@ -64,58 +73,41 @@ class Issue:
     github_number: int | None = None
 
     @classmethod
-    def from_json(cls, data: dict[str, Any], source: Path | None = None) -> Issue:
-        return cls(
-            id=data["id"],
-            title=data["title"],
-            type=data["type"],
-            status=data["status"],
-            priority=data["priority"],
-            labels=data.get("labels", []),
-            milestone=data.get("milestone", ""),
-            description=data.get("description", ""),
-            acceptance_criteria=data.get("acceptance_criteria", []),
-            epic=data.get("epic"),
-            depends_on=data.get("depends_on", []),
-            blocks=data.get("blocks", []),
-            user_story=data.get("user_story"),
-            technical_context=data.get("technical_context", {}),
-            state_machine=data.get("state_machine"),
-            out_of_scope=data.get("out_of_scope", []),
-            open_questions=data.get("open_questions", []),
-            estimate=data.get("estimate"),
-            children=data.get("children", []),
-            goals=data.get("goals", []),
-            design_principles=data.get("design_principles", []),
-            visual_mockups=data.get("visual_mockups"),
-            interaction_patterns=data.get("interaction_patterns"),
-            responsive_behavior=data.get("responsive_behavior"),
-            source_file=source,
-        )
+    def from_json(cls, data: bytes, source: Path | None = None) -> Issue:
+        issue = _ISSUE_DECODER.decode(data)
+        issue.source_file = source
+        return issue
+
+    # dict=True gives the struct a __dict__, so these memos stay out of the encoded/compared fields.
+    @cached_property
+    def normalized_title(self) -> str:
+        return normalize_title(self.title)
 
     def content_hash(self) -> str:
-        normalized = json.dumps(self._hashable_dict(), sort_keys=True, default=str)
-        return hashlib.sha256(normalized.encode()).hexdigest()[:16]
-
-    def _hashable_dict(self) -> dict[str, Any]:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "type": self.type,
-            "priority": self.priority,
-            "labels": sorted(self.labels),
-            "description": self.description,
-            "acceptance_criteria": self.acceptance_criteria,
-            "epic": self.epic,
-            "depends_on": sorted(self.depends_on),
-            "user_story": self.user_story,
-            "technical_context": self.technical_context,
-            "state_machine": self.state_machine,
-            "out_of_scope": self.out_of_scope,
-            "goals": self.goals,
-        }
+        return self._content_hash
+
+    @cached_property
+    def _content_hash(self) -> str:
+        hasher = hashlib.blake2b(digest_size=8)
+        update = hasher.update
+        for text in (self.id, self.title, self.type, self.priority, self.description, self.epic, self.user_story):
+            update(b"-\0" if text is None else b"+" + text.encode() + b"\0")
+        for items in (sorted(self.labels), sorted(self.depends_on), self.out_of_scope, self.goals):
+            update(b"%d\0" % len(items))
+            for item in items:
+                update(str(item).encode() + b"\0")
+        for nested in (self.acceptance_criteria, self.technical_context, self.state_machine):
+            update(json.dumps(nested, sort_keys=True, default=str).encode() + b"\0")
+        return hasher.hexdigest()
 
     def to_markdown(self) -> str:
+        return self._markdown
+
+    @cached_property
+    def _markdown(self) -> str:
+        return self._render_markdown()
+
+    def _render_markdown(self) -> str:
         sections = [self._header(), self._body()]
         if self.user_story:
             sections.append(self._user_story_section())
@@ -143,42 +135,43 @@ class Issue:
         return " | ".join(parts)
 
     def _body(self) -> str:
-        lines = []
-        if self.goals:
-            lines.append("### Goals\n")
-            lines.extend(f"- {g}" for g in self.goals)
-            lines.append("")
-        lines.append(self.description)
-        return "\n".join(lines)
+        if not self.goals:
+            return self.description
+        goals = "\n".join([f"- {g}" for g in self.goals])
+        return f"### Goals\n\n{goals}\n\n{self.description}"
 
     def _user_story_section(self) -> str:
         return f"### User Story\n\n> {self.user_story}"
 
     def _acceptance_criteria_section(self) -> str:
-        lines = ["### Acceptance Criteria\n"]
-        for ac in self.acceptance_criteria:
-            lines.append(f"**{ac['id']}**")
-            lines.append(f"- **Given** {ac['given']}")
-            lines.append(f"- **When** {ac['when']}")
-            lines.append(f"- **Then** {ac['then']}")
-            if ac.get("notes"):
-                lines.append(f"- *Note: {ac['notes']}*")
-            lines.append("")
-        return "\n".join(lines)
+        return "\n".join(
+            ["### Acceptance Criteria\n"]
+            + [
+                f"**{ac['id']}**\n- **Given** {ac['given']}\n- **When** {ac['when']}\n- **Then** {ac['then']}"
+                + (f"\n- *Note: {ac['notes']}*" if ac.get("notes") else "")
+                + "\n"
+                for ac in self.acceptance_criteria
+            ]
+        )
 
     def _state_machine_section(self) -> str:
         sm = self.state_machine
-        lines = ["### State Machine\n"]
-        lines.append(f"**Initial State:** `{sm['initial']}`\n")
-        lines.append("#### States")
-        for state in sm.get("states", []):
-            terminal = " (terminal)" if state.get("terminal") else ""
-            lines.append(f"- `{state['name']}`{terminal}: {state['description']}")
-        lines.append("\n#### Transitions")
-        for t in sm.get("transitions", []):
-            guard = f" [{t['guard']}]" if t.get("guard") else ""
-            lines.append(f"- `{t['from']}` → `{t['to']}`: {t['trigger']}{guard}")
-        return "\n".join(lines)
+        return "\n".join(
+            [
+                "### State Machine\n",
+                f"**Initial State:** `{sm['initial']}`\n",
+                "#### States",
+                *[
+                    f"- `{st['name']}`{' (terminal)' if st.get('terminal') else ''}: {st['description']}"
+                    for st in sm.get("states", [])
+                ],
+                "\n#### Transitions",
+                *[
+                    f"- `{t['from']}` → `{t['to']}`: {t['trigger']}" + (f" [{t['guard']}]" if t.get("guard") else "")
+                    for t in sm.get("transitions", [])
+                ],
+            ]
+        )
 
     def _technical_context_section(self) -> str:
         tc = self.technical_context
@@ -186,137 +179,89 @@ class Issue:
         if tc.get("crates"):
             lines.append(f"**Crates:** `{'`, `'.join(tc['crates'])}`\n")
         if tc.get("files"):
-            lines.append("**Files:**")
-            lines.extend(f"- `{f}`" for f in tc["files"])
-            lines.append("")
+            lines += ["**Files:**", *[f"- `{f}`" for f in tc["files"]], ""]
         if tc.get("data_structures"):
             lines.append("#### Data Structures")
-            for ds in tc["data_structures"]:
-                lines.append(f"\n**`{ds['name']}`** - {ds.get('description', '')}")
-                if ds.get("fields"):
-                    for name, typ in ds["fields"].items():
-                        lines.append(f"- `{name}`: {typ}")
+            lines += [
+                f"\n**`{ds['name']}`** - {ds.get('description', '')}"
+                + "".join([f"\n- `{name}`: {typ}" for name, typ in (ds.get("fields") or {}).items()])
+                for ds in tc["data_structures"]
+            ]
         if tc.get("interfaces"):
             lines.append("\n#### Interfaces")
-            for iface in tc["interfaces"]:
-                lines.append(f"\n**`{iface['name']}`**")
-                lines.append(f"```rust\n{iface['signature']}\n```")
-                lines.append(iface.get("description", ""))
+            lines += [
+                f"\n**`{iface['name']}`**\n```rust\n{iface['signature']}\n```\n{iface.get('description', '')}"
+                for iface in tc["interfaces"]
+            ]
         if tc.get("error_cases"):
-            lines.append("\n#### Error Cases")
-            lines.extend(f"- {e}" for e in tc["error_cases"])
+            lines += ["\n#### Error Cases", *[f"- {e}" for e in tc["error_cases"]]]
         if tc.get("performance_constraints"):
-            pc = tc["performance_constraints"]
             lines.append("\n#### Performance Constraints")
-            for k, v in pc.items():
-                lines.append(f"- **{k.replace('_', ' ').title()}:** {v}")
+            lines += [f"- **{k.replace('_', ' ').title()}:** {v}" for k, v in tc["performance_constraints"].items()]
         return "\n".join(lines)
 
     def _visual_mockups_section(self) -> str:
-        lines = ["### Visual Mockups\n"]
+        buf = StringIO()
+        w = buf.write
+        w("### Visual Mockups\n")
         for name, mockup in self.visual_mockups.items():
-            lines.append(f"#### {name.replace('_', ' ').title()}\n")
+            w(f"\n#### {name.replace('_', ' ').title()}\n")
             if mockup.get("description"):
-                lines.append(f"{mockup['description']}\n")
-            if mockup.get("content"):
-                content = mockup["content"]
+                w(f"\n{mockup['description']}\n")
+            content = mockup.get("content")
+            if content:
                 if isinstance(content, list):
-                    lines.append("```")
-                    lines.extend(content)
-                    lines.append("```")
+                    w("\n```\n" + "\n".join(content) + "\n```")
                 elif isinstance(content, dict):
-                    lines.append("```json")
-                    lines.append(json.dumps(content, indent=2))
-                    lines.append("```")
-            if mockup.get("frames"):
-                for frame in mockup["frames"]:
-                    lines.append(f"\n**Frame {frame.get('frame', '?')}** ({frame.get('duration_ms', '?')}ms)")
-                    if frame.get("content"):
-                        lines.append("```")
-                        lines.extend(frame["content"])
-                        lines.append("```")
-                    if frame.get("note"):
-                        lines.append(f"*{frame['note']}*")
+                    w(f"\n```json\n{json.dumps(content, indent=2)}\n```")
+            for frame in mockup.get("frames") or ():
+                w(f"\n\n**Frame {frame.get('frame', '?')}** ({frame.get('duration_ms', '?')}ms)")
+                if frame.get("content"):
+                    w("\n```\n" + "\n".join(frame["content"]) + "\n```")
+                if frame.get("note"):
+                    w(f"\n*{frame['note']}*")
             if mockup.get("color_scheme"):
-                lines.append("\n**Color Scheme:**")
+                w("\n\n**Color Scheme:**")
                 for elem, color in mockup["color_scheme"].items():
-                    lines.append(f"- `{elem}`: {color}")
-            lines.append("")
-        return "\n".join(lines)
+                    w(f"\n- `{elem}`: {color}")
+            w("\n")
+        return buf.getvalue()
 
     def _out_of_scope_section(self) -> str:
-        lines = ["### Out of Scope\n"]
-        lines.extend(f"- {item}" for item in self.out_of_scope)
-        return "\n".join(lines)
+        return "### Out of Scope\n\n" + "\n".join([f"- {item}" for item in self.out_of_scope])
 
     def _open_questions_section(self) -> str:
-        lines = ["### Open Questions\n"]
-        lines.extend(f"- [ ] {q}" for q in self.open_questions)
-        return "\n".join(lines)
+        return "### Open Questions\n\n" + "\n".join([f"- [ ] {q}" for q in self.open_questions])
 
     def _metadata_section(self) -> str:
         lines = ["---", f"*Source: `{self.source_file}`*" if self.source_file else ""]
         lines.append(f"*Content Hash: `{self.content_hash()}`*")
+        lines.append(f"*Hash-Algo: {CONTENT_HASH_ALGO}*")
         return "\n".join(filter(None, lines))
 
 
-@dataclass(slots=True)
-class SyncRecord:
+_ISSUE_DECODER = msgspec.json.Decoder(Issue)
+
+
+class SyncRecord(msgspec.Struct, gc=False):
     issue_id: str
     action: SyncAction
     status: SyncStatus
     github_number: int | None = None
     content_hash: str | None = None
     error: str | None = None
-    timestamp: datetime = field(default_factory=datetime.utcnow)
-
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "issue_id": self.issue_id,
-            "action": self.action.value,
-            "status": self.status.value,
-            "github_number": self.github_number,
-            "content_hash": self.content_hash,
-            "error": self.error,
-            "timestamp": self.timestamp.isoformat(),
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> SyncRecord:
-        return cls(
-            issue_id=data["issue_id"],
-            action=SyncAction(data["action"]),
-            status=SyncStatus(data["status"]),
-            github_number=data.get("github_number"),
-            content_hash=data.get("content_hash"),
-            error=data.get("error"),
-            timestamp=datetime.fromisoformat(data["timestamp"]),
-        )
+    timestamp: datetime = msgspec.field(default_factory=lambda: datetime.now(UTC))
 
 
-@dataclass(slots=True)
-class SyncState:
+class SyncState(msgspec.Struct):
     run_id: str
     started_at: datetime
     completed_at: datetime | None
-    records: dict[str, SyncRecord] = field(default_factory=dict)
-
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "run_id": self.run_id,
-            "started_at": self.started_at.isoformat(),
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "records": {k: v.to_dict() for k, v in self.records.items()},
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> SyncState:
-        return cls(
-            run_id=data["run_id"],
-            started_at=datetime.fromisoformat(data["started_at"]),
-            completed_at=datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None,
-            records={k: SyncRecord.from_dict(v) for k, v in data.get("records", {}).items()},
-        )
+    records: dict[str, SyncRecord] = {}
+    # Stored as "owner/name" to keep the state file readable. The origin URL it was detected
+    # from is kept alongside so a fork or renamed remote doesn't reuse a committed value.
+    repo: str | None = None
+    remote_url: str | None = None
 
     def is_completed(self, issue_id: str) -> bool:
         record = self.records.get(issue_id)
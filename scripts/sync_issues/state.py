@@ -1,21 +1,33 @@
 from __future__ import annotations
 
-import json
-import uuid
-from datetime import datetime
+import os
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from .models import SyncRecord, SyncState, SyncStatus
+import msgspec
+import orjson
+
+from .models import SyncAction, SyncRecord, SyncState, SyncStatus
 
 if TYPE_CHECKING:
-    from .models import Issue, SyncAction
+    from .models import Issue
+
+_STATE_ENCODER = msgspec.json.Encoder()
+_STATE_DECODER = msgspec.json.Decoder(SyncState)
 
 
 class StateManager:
     def __init__(self, state_file: Path):
         self.state_file = state_file
         self._state: SyncState | None = None
+        self._dirty = False
+        self._autosave = True
+        self._summary_cache: dict[SyncStatus, int] | None = None
+        self._batch_now: datetime | None = None
 
     @property
     def state(self) -> SyncState:
@@ -25,29 +37,62 @@ class StateManager:
 
     def _load_or_create(self) -> SyncState:
         if self.state_file.exists():
-            data = json.loads(self.state_file.read_text())
-            return SyncState.from_dict(data)
-        return SyncState(
-            run_id=str(uuid.uuid4())[:8],
-            started_at=datetime.utcnow(),
-            completed_at=None,
-        )
+            return _STATE_DECODER.decode(self.state_file.read_bytes())
+        return SyncState(run_id=self._new_run_id(), started_at=self._now(), completed_at=None)
+
+    @staticmethod
+    def _new_run_id() -> str:
+        import uuid
+
+        return str(uuid.uuid4())[:8]
+
+    def _now(self) -> datetime:
+        return self._batch_now or datetime.now(UTC)
 
     def save(self):
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        self.state_file.write_text(json.dumps(self.state.to_dict(), indent=2, default=str))
+        tmp = self.state_file.with_name(self.state_file.name + ".tmp")
+        tmp.write_bytes(msgspec.json.format(_STATE_ENCODER.encode(self.state), indent=2))
+        os.replace(tmp, self.state_file)
+        self._dirty = False
+
+    def _maybe_save(self) -> None:
+        self._dirty = True
+        self._summary_cache = None
+        if self._autosave:
+            self.save()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        # One timestamp per batch is precise enough and saves a clock read per record.
+        previous, self._autosave = self._autosave, False
+        if previous:
+            self._batch_now = datetime.now(UTC)
+        try:
+            yield
+        finally:
+            self._autosave = previous
+            if previous:
+                self._batch_now = None
+                if self._dirty:
+                    self.save()
 
     def reset(self):
         if self.state_file.exists():
             self.state_file.unlink()
         self._state = None
+        self._dirty = False
+        self._summary_cache = None
 
     def start_new_run(self) -> str:
         self._state = SyncState(
-            run_id=str(uuid.uuid4())[:8],
-            started_at=datetime.utcnow(),
+            run_id=self._new_run_id(),
+            started_at=self._now(),
             completed_at=None,
+            repo=self._state.repo if self._state else None,
+            remote_url=self._state.remote_url if self._state else None,
         )
+        self._summary_cache = None
         self.save()
         return self.state.run_id
 
@@ -56,8 +101,9 @@ class StateManager:
             issue_id=issue_id,
             action=action,
             status=SyncStatus.IN_PROGRESS,
+            timestamp=self._now(),
         )
-        self.save()
+        self._maybe_save()
 
     def mark_completed(self, issue_id: str, github_number: int, content_hash: str):
         record = self.state.records.get(issue_id)
@@ -65,27 +111,29 @@ class StateManager:
             record.status = SyncStatus.COMPLETED
             record.github_number = github_number
             record.content_hash = content_hash
-            record.timestamp = datetime.utcnow()
-        self.save()
+            record.timestamp = self._now()
+        self._maybe_save()
 
     def mark_failed(self, issue_id: str, error: str):
         record = self.state.records.get(issue_id)
         if record:
             record.status = SyncStatus.FAILED
             record.error = error
-            record.timestamp = datetime.utcnow()
-        self.save()
+            record.timestamp = self._now()
+        self._maybe_save()
 
     def mark_skipped(self, issue_id: str, github_number: int | None = None):
-        record = self.state.records.get(issue_id)
-        if record:
-            record.status = SyncStatus.SKIPPED
-            record.github_number = github_number
-            record.timestamp = datetime.utcnow()
-        self.save()
+        self.state.records[issue_id] = SyncRecord(
+            issue_id=issue_id,
+            action=SyncAction.SKIP,
+            status=SyncStatus.SKIPPED,
+            github_number=github_number,
+            timestamp=self._now(),
+        )
+        self._maybe_save()
 
     def mark_run_completed(self):
-        self.state.completed_at = datetime.utcnow()
+        self.state.completed_at = self._now()
         self.save()
 
     def is_completed(self, issue_id: str) -> bool:
@@ -98,17 +146,60 @@ class StateManager:
         record = self.state.records.get(issue_id)
         return record.github_number if record else None
 
+    def get_synced_hash(self, issue_id: str) -> str | None:
+        record = self.state.records.get(issue_id)
+        return record.content_hash if record and record.status == SyncStatus.COMPLETED else None
+
+    def _counts(self) -> dict[SyncStatus, int]:
+        if self._summary_cache is None:
+            counts = Counter(r.status for r in self.state.records.values())
+            self._summary_cache = {s: counts[s] for s in SyncStatus}
+        return self._summary_cache
+
     def pending_count(self) -> int:
-        return sum(1 for r in self.state.records.values() if r.status == SyncStatus.PENDING)
+        return self._counts()[SyncStatus.PENDING]
 
     def completed_count(self) -> int:
-        return sum(1 for r in self.state.records.values() if r.status == SyncStatus.COMPLETED)
+        return self._counts()[SyncStatus.COMPLETED]
 
     def failed_count(self) -> int:
-        return sum(1 for r in self.state.records.values() if r.status == SyncStatus.FAILED)
+        return self._counts()[SyncStatus.FAILED]
 
     def summary(self) -> dict[str, int]:
-        counts = {s: 0 for s in SyncStatus}
-        for record in self.state.records.values():
-            counts[record.status] += 1
-        return {s.value: c for s, c in counts.items()}
+        return {s.value: c for s, c in self._counts().items()}
+
+
+class ETagCache:
+    def __init__(self, cache_file: Path) -> None:
+        self.cache_file = cache_file
+        self._entries: dict[str, dict[str, str]] | None = None
+        self._dirty = False
+
+    @property
+    def entries(self) -> dict[str, dict[str, str]]:
+        if self._entries is None:
+            self._entries = orjson.loads(self.cache_file.read_bytes()) if self.cache_file.exists() else {}
+        return self._entries
+
+    def get(self, key: str) -> tuple[str, bytes] | None:
+        entry = self.entries.get(key)
+        if not entry or "body" not in entry:
+            return None
+        return entry["etag"], entry["body"].encode()
+
+    def put(self, key: str, etag: str, body: bytes) -> None:
+        self.entries[key] = {"etag": etag, "body": body.decode()}
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_file.write_bytes(orjson.dumps(self.entries))
+        self._dirty = False
+
+    def reset(self) -> None:
+        if self.cache_file.exists():
+            self.cache_file.unlink()
+        self._entries = None
+        self._dirty = False
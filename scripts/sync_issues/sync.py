@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import os
+import pickle
 import re
 import sys
+import time
+from collections.abc import Coroutine, Sequence
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Protocol
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
 
-from .models import Issue, SyncAction, SyncStatus
+from .github import GitHubError, IssueMutation
+from .models import CONTENT_HASH_ALGO, Issue, SyncAction, SyncStatus
 
 if TYPE_CHECKING:
-    from .github import GitHubClient, GitHubIssue, GitHubLabel, GitHubMilestone
+    from .github import DryRunClient, GitHubClient, GitHubIssue, GitHubLabel, GitHubMilestone
     from .loader import IssueIndex, IssueLoader, LabelDef, MilestoneDef
     from .state import StateManager
 
@@ -30,8 +38,13 @@ class ConsoleOutput:
     RED = "\033[31m"
     CYAN = "\033[36m"
 
+    PROGRESS_INTERVAL = 0.05
+    BAR_WIDTH = 20
+
     def __init__(self, use_color: bool = True):
         self.use_color = use_color and sys.stdout.isatty()
+        self._bars = [self._c(self.CYAN, "█" * n + "░" * (self.BAR_WIDTH - n)) for n in range(self.BAR_WIDTH + 1)]
+        self._last_progress_ts = 0.0
 
     def _c(self, code: str, text: str) -> str:
         return f"{code}{text}{self.RESET}" if self.use_color else text
@@ -49,13 +62,15 @@ class ConsoleOutput:
         print(f"  {self._c(self.RED, '✗')} {msg}")
 
     def progress(self, current: int, total: int, msg: str):
+        done = current == total
+        now = time.monotonic()
+        if not done and now - self._last_progress_ts < self.PROGRESS_INTERVAL:
+            return
+        self._last_progress_ts = now
         pct = (current / total) * 100 if total else 0
-        bar_width = 20
-        filled = int(bar_width * current / total) if total else 0
-        bar = "█" * filled + "░" * (bar_width - filled)
-        print(f"\r  {self._c(self.CYAN, bar)} {pct:5.1f}% {msg:<50}", end="", flush=True)
-        if current == total:
-            print()
+        bar = self._bars[self.BAR_WIDTH * current // total if total else 0]
+        sys.stdout.write(f"\r  {bar} {pct:5.1f}% {msg:<50}\n" if done else f"\r  {bar} {pct:5.1f}% {msg:<50}")
+        sys.stdout.flush()
 
 
 @dataclass
@@ -75,27 +90,33 @@ class SyncPlan:
 
 class IssueSyncer:
     ISSUE_ID_PATTERN = re.compile(r"\*\*([A-Z]+-\d+)\*\*")
+    MAX_CONCURRENCY = 5
+    MUTATION_BATCH_SIZE = 20
 
     def __init__(
         self,
-        client: GitHubClient,
+        client: GitHubClient | DryRunClient,
         loader: IssueLoader,
         state: StateManager,
         output: OutputHandler | None = None,
+        concurrency: int = MAX_CONCURRENCY,
+        cache_dir: Path | None = None,
     ):
         self.client = client
         self.loader = loader
         self.state = state
         self.output = output or ConsoleOutput()
+        self.concurrency = concurrency
+        self.cache_dir = cache_dir
         self._milestones: dict[str, int] = {}
-        self._labels: set[str] = set()
+        self._labels: frozenset[str] = frozenset()
+        self._resolved_labels: dict[str, list[str]] = {}
         self._existing_issues: dict[str, tuple[int, str]] = {}
 
-    def sync(self, force: bool = False) -> dict[str, int]:
-        self._load_github_state()
-        issues = self.loader.load_all_issues()
-        index = self._build_index(issues)
-        ordered = self.loader.topological_sort(issues)
+    async def sync(self, force: bool = False) -> dict[str, int]:
+        await self._load_github_state()
+        ordered = self._load_ordered_issues()
+        index = self._build_index(ordered)
 
         plan = self._build_plan(ordered, force)
         self._print_plan(plan)
@@ -104,30 +125,78 @@ class IssueSyncer:
             self.output.success("Nothing to sync")
             return self.state.summary()
 
-        self._ensure_labels()
-        self._ensure_milestones()
-        self._execute_plan(plan, index)
+        await asyncio.gather(self._ensure_labels(), self._ensure_milestones())
+        await self._execute_plan(plan, index)
 
         self.state.mark_run_completed()
         return self.state.summary()
 
-    def _load_github_state(self):
+    async def _load_github_state(self):
         self.output.info("Loading GitHub state...")
 
-        for milestone in self.client.list_milestones():
+        async for milestone in self.client.list_milestones():
             self._milestones[milestone.title] = milestone.number
 
-        for label in self.client.list_labels():
-            self._labels.add(label.name)
-
-        for gh_issue in self.client.list_issues():
-            match = self.ISSUE_ID_PATTERN.search(gh_issue.body)
-            if match:
+        self._labels = frozenset([label.name async for label in self.client.list_labels()])
+
+        # The ID header sits near the top unless long Depends On/Blocks refs push it down.
+        search = self.ISSUE_ID_PATTERN.search
+        async for gh_issue in self.client.list_issues():
+            body = gh_issue.body
+            issue_id = self._leading_issue_id(body)
+            if issue_id is None:
+                match = search(body, 0, 200) or search(body)
+                if match is None:
+                    continue
                 issue_id = match.group(1)
-                self._existing_issues[issue_id] = (gh_issue.number, gh_issue.body)
+            self._existing_issues[issue_id] = (gh_issue.number, body)
 
         self.output.success(f"Found {len(self._existing_issues)} existing issues")
 
+    def _load_ordered_issues(self) -> list[Issue]:
+        if self.cache_dir is None:
+            return self.loader.topological_sort(self.loader.load_all_issues())
+
+        cache_file = self.cache_dir / f"{self._issues_manifest_hash()}.pkl"
+        try:
+            with open(cache_file, "rb") as f:
+                cached: list[Issue] = pickle.load(f)
+                return cached
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+            pass
+
+        ordered = self.loader.topological_sort(self.loader.load_all_issues())
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for stale in self.cache_dir.glob("*.pkl"):
+            stale.unlink(missing_ok=True)
+        tmp = cache_file.with_suffix(".tmp")
+        tmp.write_bytes(pickle.dumps(ordered, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, cache_file)
+        return ordered
+
+    def _issues_manifest_hash(self) -> str:
+        # The package's own sources are mixed in so any change to how issues are parsed or
+        # represented also invalidates the pickle, not just edits to the issue files.
+        h = hashlib.blake2b(digest_size=16)
+        modules = sorted(str(p) for p in Path(__file__).parent.glob("*.py"))
+        for path in [*modules, *sorted(self.loader.iter_issue_files())]:
+            st = os.stat(path)
+            h.update(path.encode())
+            h.update(st.st_mtime_ns.to_bytes(8, "little"))
+            h.update(st.st_size.to_bytes(8, "little"))
+        return h.hexdigest()
+
+    @staticmethod
+    def _leading_issue_id(body: str) -> str | None:
+        if not body.startswith("**"):
+            return None
+        end = body.find("**", 2)
+        issue_id = body[2:end]
+        prefix, _, number = issue_id.rpartition("-")
+        if end > 2 and issue_id.isascii() and prefix.isalpha() and prefix.isupper() and number.isdigit():
+            return issue_id
+        return None
+
     def _build_index(self, issues: list[Issue]) -> IssueIndex:
         from .loader import IssueIndex
         return IssueIndex(issues)
@@ -147,117 +216,148 @@ class IssueSyncer:
 
         return plan
 
+    @staticmethod
+    def _github_title(issue: Issue) -> str:
+        return f"[{issue.type.upper()}] {issue.title}"
+
     def _content_changed(self, issue: Issue, existing_body: str) -> bool:
+        # Bodies written with another hash algorithm can never match; resync them once without hashing.
+        if f"Hash-Algo: {CONTENT_HASH_ALGO}" not in existing_body:
+            return True
         current_hash = issue.content_hash()
         if f"Content Hash: `{current_hash}`" in existing_body:
             return False
-        return self.state.needs_sync(issue)
+        return self.state.get_synced_hash(issue.id) != current_hash
 
     def _print_plan(self, plan: SyncPlan):
         self.output.info(f"Plan: {len(plan.creates)} create, {len(plan.updates)} update, {len(plan.skips)} skip")
 
-    def _ensure_labels(self):
-        defined = self.loader.load_labels()
-        for label_def in defined:
-            if label_def.name not in self._labels:
-                self.client.create_label(label_def.name, label_def.color, label_def.description)
-                self._labels.add(label_def.name)
-                self.output.success(f"Created label: {label_def.name}")
-
-    def _ensure_milestones(self):
-        defined = self.loader.load_milestones()
-        for ms_def in defined:
-            if ms_def.title not in self._milestones:
-                milestone = self.client.create_milestone(ms_def.title, ms_def.description)
-                self._milestones[ms_def.title] = milestone.number
-                self.output.success(f"Created milestone: {ms_def.title}")
-
-    def _execute_plan(self, plan: SyncPlan, index: IssueIndex):
+    async def _ensure_labels(self):
+        missing = [label_def for label_def in self.loader.load_labels() if label_def.name not in self._labels]
+        if not missing:
+            return
+        created = await self.client.bulk_create_labels([(d.name, d.color, d.description) for d in missing])
+        self._labels |= {label.name for label in created}
+        self._resolved_labels.clear()
+        for label in created:
+            self.output.success(f"Created label: {label.name}")
+
+    async def _ensure_milestones(self):
+        missing = [ms_def for ms_def in self.loader.load_milestones() if ms_def.title not in self._milestones]
+        if not missing:
+            return
+        created = await self.client.bulk_create_milestones([(d.title, d.description) for d in missing])
+        for milestone in created:
+            self._milestones[milestone.title] = milestone.number
+            self.output.success(f"Created milestone: {milestone.title}")
+
+    async def _execute_plan(self, plan: SyncPlan, index: IssueIndex):
+        sem = asyncio.Semaphore(self.concurrency)
         total = plan.actions_needed
         current = 0
 
-        for issue in plan.creates:
-            current += 1
-            self.output.progress(current, total, f"Creating {issue.id}")
-            self._create_issue(issue, index)
-
-        for issue, number in plan.updates:
-            current += 1
-            self.output.progress(current, total, f"Updating {issue.id}")
-            self._update_issue(issue, number, index)
-
-        for issue, number in plan.skips:
-            self.state.mark_started(issue.id, SyncAction.SKIP)
-            self.state.mark_skipped(issue.id, number)
-
-    def _create_issue(self, issue: Issue, index: IssueIndex):
-        self.state.mark_started(issue.id, SyncAction.CREATE)
-
+        async def _run(batch: list[tuple[Issue, int | None]], verb: str) -> None:
+            nonlocal current
+            async with sem:
+                current += len(batch)
+                self.output.progress(current, total, f"{verb} {batch[-1][0].id}")
+                await self._sync_batch(batch, index)
+
+        # Dependents render "Depends On" refs from _existing_issues, so each wave
+        # must finish creating before the next one starts.
+        for wave in self._creation_waves(plan.creates):
+            batches = self._chunk([(issue, None) for issue in wave])
+            with self.state.batch():
+                await self._run_all([_run(batch, "Creating") for batch in batches])
+
+        with self.state.batch():
+            await self._run_all([_run(batch, "Updating") for batch in self._chunk(plan.updates)])
+
+        with self.state.batch():
+            for issue, number in plan.skips:
+                self.state.mark_skipped(issue.id, number)
+
+    @staticmethod
+    async def _run_all(coros: list[Coroutine[Any, Any, None]]) -> None:
+        # TaskGroup cancels and awaits in-flight siblings when one batch fails, so nothing is still
+        # writing to the client or the state after the phase's state batch has flushed.
         try:
-            labels = self._resolve_labels(issue)
-            milestone = self._milestones.get(issue.milestone)
-            body = self._render_body(issue, index)
+            async with asyncio.TaskGroup() as tg:
+                for coro in coros:
+                    tg.create_task(coro)
+        except ExceptionGroup as group:
+            raise group.exceptions[0] from group
+
+    @staticmethod
+    def _creation_waves(creates: list[Issue]) -> list[list[Issue]]:
+        depth: dict[str, int] = {}
+        waves: list[list[Issue]] = []
+        for issue in creates:
+            level = max((depth[dep] + 1 for dep in issue.depends_on if dep in depth), default=0)
+            depth[issue.id] = level
+            if level == len(waves):
+                waves.append([])
+            waves[level].append(issue)
+        return waves
+
+    def _chunk(self, items: Sequence[tuple[Issue, int | None]]) -> list[list[tuple[Issue, int | None]]]:
+        size = self.MUTATION_BATCH_SIZE
+        return [list(items[i : i + size]) for i in range(0, len(items), size)]
+
+    async def _sync_batch(self, batch: list[tuple[Issue, int | None]], index: IssueIndex):
+        for issue, number in batch:
+            self.state.mark_started(issue.id, SyncAction.CREATE if number is None else SyncAction.UPDATE)
 
-            gh_issue = self.client.create_issue(
-                title=f"[{issue.type.upper()}] {issue.title}",
-                body=body,
-                labels=labels,
-                milestone=milestone,
-            )
-
-            self._existing_issues[issue.id] = (gh_issue.number, gh_issue.body)
-            self.state.mark_completed(issue.id, gh_issue.number, issue.content_hash())
-            self.output.success(f"Created #{gh_issue.number}: {issue.id}")
+        try:
+            mutations = [
+                IssueMutation(
+                    title=self._github_title(issue),
+                    body=self._render_body(issue, index),
+                    labels=self._resolve_labels(issue),
+                    milestone=self._milestones.get(issue.milestone),
+                    number=number,
+                )
+                for issue, number in batch
+            ]
+            results = await self.client.batch_mutate(mutations)
 
         except Exception as e:
-            self.state.mark_failed(issue.id, str(e))
-            self.output.error(f"Failed {issue.id}: {e}")
+            for issue, _ in batch:
+                self.state.mark_failed(issue.id, str(e))
+                self.output.error(f"Failed {issue.id}: {e}")
             raise
 
-    def _update_issue(self, issue: Issue, number: int, index: IssueIndex):
-        self.state.mark_started(issue.id, SyncAction.UPDATE)
+        failure: GitHubError | None = None
+        for (issue, number), result in zip(batch, results, strict=True):
+            if isinstance(result, GitHubError):
+                self.state.mark_failed(issue.id, str(result))
+                self.output.error(f"Failed {issue.id}: {result}")
+                failure = failure or result
+                continue
 
-        try:
-            labels = self._resolve_labels(issue)
-            milestone = self._milestones.get(issue.milestone)
-            body = self._render_body(issue, index)
-
-            gh_issue = self.client.update_issue(
-                number=number,
-                title=f"[{issue.type.upper()}] {issue.title}",
-                body=body,
-                labels=labels,
-                milestone=milestone,
-            )
-
-            self._existing_issues[issue.id] = (gh_issue.number, gh_issue.body)
-            self.state.mark_completed(issue.id, gh_issue.number, issue.content_hash())
-            self.output.success(f"Updated #{gh_issue.number}: {issue.id}")
+            self._existing_issues[issue.id] = (result.number, result.body)
+            self.state.mark_completed(issue.id, result.number, issue.content_hash())
+            self.output.success(f"{'Created' if number is None else 'Updated'} #{result.number}: {issue.id}")
 
-        except Exception as e:
-            self.state.mark_failed(issue.id, str(e))
-            self.output.error(f"Failed {issue.id}: {e}")
-            raise
+        if failure is not None:
+            raise failure
 
     def _resolve_labels(self, issue: Issue) -> list[str]:
-        return [lbl for lbl in issue.labels if lbl in self._labels]
+        cached = self._resolved_labels.get(issue.id)
+        if cached is None:
+            cached = self._resolved_labels[issue.id] = [lbl for lbl in issue.labels if lbl in self._labels]
+        return cached
 
     def _render_body(self, issue: Issue, index: IssueIndex) -> str:
-        body = issue.to_markdown()
-
-        if issue.depends_on:
-            refs = self._render_issue_refs("Depends On", issue.depends_on)
-            body = f"{refs}\n\n{body}"
-
+        parts = []
         if issue.blocks:
-            refs = self._render_issue_refs("Blocks", issue.blocks)
-            body = f"{refs}\n\n{body}"
-
+            parts.append(self._render_issue_refs("Blocks", issue.blocks))
+        if issue.depends_on:
+            parts.append(self._render_issue_refs("Depends On", issue.depends_on))
+        parts.append(issue.to_markdown())
         if issue.children:
-            refs = self._render_issue_refs("Child Issues", issue.children)
-            body = f"{body}\n\n{refs}"
-
-        return body
+            parts.append(self._render_issue_refs("Child Issues", issue.children))
+        return "\n\n".join(parts)
 
     def _render_issue_refs(self, label: str, issue_ids: list[str]) -> str:
         refs = []